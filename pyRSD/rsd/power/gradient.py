@@ -45,7 +45,14 @@ def compute(registry, name, m, pars, k, mu):
     mu : array_like
         the array of `mu` values to evaluate the derivative at
     """
-    if name not in set(pars.valid_model_params)|set(pars.free_names):
+    # the set of relevant names is rebuilt only when the parameter set
+    # is mutated; this runs once per parameter (and recursively for the
+    # constrained children) on every gradient evaluation
+    valid = getattr(pars, '_grad_valid_names', None)
+    if valid is None:
+        valid = pars._grad_valid_names = set(pars.valid_model_params)|set(pars.free_names)
+
+    if name not in valid:
         logging.debug("ignoring parameter '%s'" %name)
         if numpy.isscalar(k):
             return 0.
@@ -90,6 +97,26 @@ def _call_power_from_driver(k, mu, theta):
     driver.theory.set_free_parameters(theta)
     return driver.model.power(k, mu)
 
+# worker-side cache of the static (k,mu) arrays, keyed on a session id;
+# this lets the master ship the arrays once and then send only the small
+# theta vector on subsequent gradient calls
+_worker_kmu_cache = {}
+
+def _call_power_cached_kmu(key, k, mu, theta):
+    """
+    Like :func:`_call_power_from_driver`, but caching the static ``k``
+    and ``mu`` arrays on the worker
+
+    On the first dispatch, ``k`` and ``mu`` are shipped and stored under
+    ``key``; afterwards the master passes ``None`` for both and the
+    cached arrays are used, so only ``theta`` travels over MPI.
+    """
+    if k is None:
+        k, mu = _worker_kmu_cache[key]
+    else:
+        _worker_kmu_cache[key] = (k, mu)
+    return _call_power_from_driver(k, mu, theta)
+
 class PkmuGradient(object):
     """
     Class to compute the gradient of `power(k,mu)`
@@ -163,7 +190,13 @@ class PkmuGradient(object):
         toret = numpy.zeros((len(theta), len(k)))
 
         if pool is not None:
-            self._call_power_mpi = functools.partial(_call_power_from_driver, k, mu)
+            # ship the static (k,mu) arrays only when they change; the
+            # workers cache them, and later calls send theta alone
+            key = (id(self), k.ctypes.data, mu.ctypes.data, len(k))
+            if getattr(self, '_kmu_key', None) != key:
+                self._call_power_mpi = functools.partial(_call_power_cached_kmu, key, k, mu)
+            else:
+                self._call_power_mpi = functools.partial(_call_power_cached_kmu, key, None, None)
 
         # cache results for speed
         with self.model.use_cache():
@@ -191,6 +224,7 @@ class PkmuGradient(object):
                 results = numpy.asarray([self._call_power(k, mu, t) for t in tasks])
             else:
                 results = numpy.array(pool.map(self._call_power_mpi, tasks))
+                self._kmu_key = key # the workers now hold (k,mu)
             results = results.reshape((2, -1, len(k)))
 
             if numpy.isscalar(epsilon):
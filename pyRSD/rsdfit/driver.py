@@ -28,6 +28,16 @@ def load_results(filename):
         result = LBFGSResults.from_npz(filename)
     return result
 
+def _call_minus_lnlike_from_driver(theta):
+    """
+    Evaluate :func:`minus_lnlike` from the global driver instance
+
+    This is defined at the module level so we can pickle it
+    """
+    from pyRSD.rsdfit import GlobalFittingDriver
+    driver = GlobalFittingDriver.get()
+    return driver.minus_lnlike(theta)
+
 class FittingDriverSchema(Cache):
     """
     The schema for the :class:`FittingDriver` class, defining the allowed
@@ -897,6 +907,28 @@ class FittingDriver(FittingDriverSchema):
     #---------------------------------------------------------------------------
     # gradient calculations
     #---------------------------------------------------------------------------
+    def _numgrad_tasks(self, theta, epsilon):
+        """
+        Return the stacked perturbed parameter vectors
+        ``theta +/- epsilon*e_i`` used for the central-difference
+        numerical gradient
+
+        The (2D, D) task matrix and the diagonal index are cached and
+        refilled in place, so repeated gradient calls do not reallocate
+        or build a fresh identity matrix.
+        """
+        D = len(theta)
+        buf = getattr(self, '_numgrad_buf', None)
+        if buf is None or buf.shape[1] != D:
+            buf = self._numgrad_buf = np.empty((2*D, D))
+            self._numgrad_idx = np.arange(D)
+
+        idx = self._numgrad_idx
+        buf[:] = theta
+        buf[idx, idx] += epsilon
+        buf[D + idx, idx] -= epsilon
+        return buf
+
     def grad_minus_lnlike(self, theta=None, epsilon=1e-4, pool=None, use_priors=True,
                             numerical=False, numerical_from_lnlike=False):
         """
@@ -948,9 +980,16 @@ class FittingDriver(FittingDriverSchema):
         # numerical gradient of minus_lnlike
         if numerical_from_lnlike:
 
-            increments = np.identity(len(theta)) * epsilon
-            tasks = np.concatenate([theta+increments, theta-increments], axis=0)
-            results = np.array([self.minus_lnlike(t) for t in tasks])
+            # the 2D perturbed parameter vectors, theta +/- epsilon*e_i,
+            # assembled into a buffer reused across iterations
+            tasks = self._numgrad_tasks(theta, epsilon)
+
+            # the evaluations are independent, so distribute them across
+            # the pool if we have one
+            if pool is None:
+                results = np.array([self.minus_lnlike(t) for t in tasks])
+            else:
+                results = np.array(pool.map(_call_minus_lnlike_from_driver, tasks))
             results = results.reshape((2, -1))
 
             grad_minus_lnlike = (results[0] - results[1]) / (2.*epsilon)
@@ -9,6 +9,7 @@
 
 import collections
 from six import string_types
+import functools
 import lmfit
 import contextlib
 import asteval
@@ -16,6 +17,65 @@ import asteval
 from . import tools, Parameter
 from ... import os, numpy as np
 
+@functools.lru_cache(maxsize=32)
+def _parse_param_file(filename, mtime):
+    """
+    Parse a parameter file into a dict of evaluated (key, value) pairs,
+    plus any saved original expressions
+
+    The result is cached on the filename and its modification time, so
+    constructing several ParameterSet objects from the same file (e.g.,
+    with different tags) only reads and evaluates it once
+    """
+    orig = {}
+    D = {}
+    old = ''
+    # loop over each line
+    for linecount, line in enumerate(open(filename, 'r')):
+        line = line.strip()
+        if len(line) == 0 or line[0] == '#':
+            continue
+        s = line.split('#')
+        line = s[0]
+        s = line.split('\\')
+        if len(s) > 1:
+            old = " ".join([old, s[0]])
+            continue
+        else:
+            line = " ".join([old, s[0]])
+            old = ''
+        for i in range(len(line)):
+            if line[i] !=' ':
+                line = line[i:]
+                break
+        line = line.split('=')
+        line = [x.strip() for x in line]
+
+        if not tools.verify_line(line, 2, linecount):
+            continue
+
+        # get the key
+        key = line[0].strip()
+
+        # check for variables in the value
+        save_orig = None
+        if '$' in line[1]:
+            save_orig = eval(line[1].strip())
+            line[1] = tools.replace_vars(line[1], D)
+
+        # check for any functions calls in the line
+        modules = tools.import_function_modules(line[1])
+
+        # now save to the dict, eval'ing the line
+        try:
+            D[key] = eval(line[1].strip(), globals().update(modules), D)
+        except:
+            raise ValueError("bad line: %s" % str(line))
+        if save_orig is not None:
+            orig[key] = save_orig
+
+    return D, orig
+
 class SmartSymTable(dict):
     def __init__(self, params):
         self.params = params
@@ -129,52 +189,9 @@ class ParameterSet(lmfit.Parameters):
         if not os.path.exists(filename):
             raise IOError("no file found at path %s" %filename)
 
-        orig = {}
-        D = {}
-        old = ''
-        # loop over each line
-        for linecount, line in enumerate(open(filename, 'r')):
-            line = line.strip()
-            if len(line) == 0 or line[0] == '#':
-                continue
-            s = line.split('#')
-            line = s[0]
-            s = line.split('\\')
-            if len(s) > 1:
-                old = " ".join([old, s[0]])
-                continue
-            else:
-                line = " ".join([old, s[0]])
-                old = ''
-            for i in range(len(line)):
-                if line[i] !=' ':
-                    line = line[i:]
-                    break
-            line = line.split('=')
-            line = [x.strip() for x in line]
-
-            if not tools.verify_line(line, 2, linecount):
-                continue
-
-            # get the key
-            key = line[0].strip()
-
-            # check for variables in the value
-            save_orig = None
-            if '$' in line[1]:
-                save_orig = eval(line[1].strip())
-                line[1] = tools.replace_vars(line[1], D)
-
-            # check for any functions calls in the line
-            modules = tools.import_function_modules(line[1])
-
-            # now save to the dict, eval'ing the line
-            try:
-                D[key] = eval(line[1].strip(), globals().update(modules), D)
-            except:
-                raise ValueError("bad line: %s" % str(line))
-            if save_orig is not None:
-                orig[key] = save_orig
+        # parse the file; cached on (filename, mtime), since the same
+        # file is typically read several times with different tags
+        D, orig = _parse_param_file(filename, os.stat(filename).st_mtime_ns)
 
         # now make the output
         valid_kwargs = ['name', 'value', 'vary', 'min', 'max', 'expr']
@@ -319,8 +336,58 @@ class ParameterSet(lmfit.Parameters):
                         if name in self[dep].children:
                             self[dep].children.remove(name)
 
+        # topologically order the constrained parameters once, so that
+        # constraint sweeps can walk a flat list instead of recursing
+        constrained = set(name for name, par in self.items() if par.expr is not None)
+        remaining = {}
+        children = dict((name, set()) for name in constrained)
+        for name in constrained:
+            deps = set(self[name]._expr_deps) & constrained
+            deps.discard(name)
+            remaining[name] = deps
+            for dep in deps:
+                children[dep].add(name)
+
+        order = []
+        ready = sorted(name for name in remaining if not remaining[name])
+        while ready:
+            name = ready.pop()
+            order.append(name)
+            for child in children[name]:
+                remaining[child].discard(name)
+                if not remaining[child]:
+                    ready.append(child)
+
+        # a cyclic graph cannot be ordered; fall back to the recursive sweep
+        self._constraint_order = order if len(order) == len(constrained) else None
+
         self._prepared = True
 
+    def update_constraints(self):
+        """
+        Update all constrained parameters, evaluating them in the flat
+        topological order computed by :func:`prepare_params`
+
+        This falls back to the recursive ``lmfit`` implementation when
+        the precomputed order is stale or the dependency graph is cyclic
+        """
+        order = getattr(self, '_constraint_order', None)
+        if order is not None:
+            # the order is stale if constraints were added without a
+            # prepare_params call in between
+            nconstrained = sum(1 for par in self.values() if par._expr is not None)
+            if nconstrained != len(order):
+                order = None
+
+        if order is None:
+            return lmfit.Parameters.update_constraints(self)
+
+        for name in order:
+            par = self[name]
+            if par._expr_eval is None:
+                par._expr_eval = self._asteval
+            self._asteval.symtable[name] = float(par.value)
+
     def update_fiducial(self):
         """
         Update the fiducial values of the constrained parameters
@@ -140,6 +140,33 @@ class LBFGSResults(object):
         else:
             return getattr(self, key)
 
+    def to_array(self, free_names=None):
+        """
+        Return the best-fit free parameter values as an array, ordered
+        according to the input ``free_names``
+
+        This gathers the values with a single fancy-index operation,
+        using a name-to-index map built once per instance, rather than
+        doing a Python-level lookup per parameter.
+
+        Parameters
+        ----------
+        free_names : list of str, optional
+            the desired ordering of the free parameters; if not provided,
+            or if it matches :attr:`free_names`, the stored values are
+            returned directly
+        """
+        if free_names is None or free_names == self.free_names:
+            return self.min_chi2_values
+
+        try:
+            index = self._free_index
+        except AttributeError:
+            index = self._free_index = dict(zip(self.free_names, range(len(self.free_names))))
+
+        inds = [index[name] for name in free_names]
+        return self.min_chi2_values[inds]
+
     def copy(self):
         """
         Return a deep copy of the :class:`LBFGSResults` object
@@ -8,6 +8,51 @@ import scipy.optimize as opt
 # machine precision
 _epsilon = np.finfo(float).eps
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _two_loop_recursion(q, s, y, rho, a, H0k, k, head):
+        """
+        The LBFGS two-loop recursion, as explicit scalar loops
+
+        For the typical problem sizes here, the cost of the recursion is
+        dominated by the dispatch overhead of the individual ``np.dot``
+        calls, so the compiled scalar loops are substantially faster.
+
+        The history arrays are circular buffers; ``head`` is the
+        physical row of the most recent correction pair.
+        """
+        M = rho.shape[0]
+        D = q.shape[0]
+        for i in range(k):
+            n = (head - i) % M
+            dot = 0.
+            for j in range(D):
+                dot += s[n, j] * q[j]
+            a[i] = rho[n] * dot
+            for j in range(D):
+                q[j] -= a[i] * y[n, j]
+
+        z = q * H0k
+
+        for i in range(k-1, -1, -1):
+            n = (head - i) % M
+            dot = 0.
+            for j in range(D):
+                dot += y[n, j] * z[j]
+            beta = rho[n] * dot
+            for j in range(D):
+                z[j] += s[n, j] * (a[i] - beta)
+
+        return z
+else:
+    _two_loop_recursion = None
+
 class LineSearchError(Exception):
     pass
 
@@ -97,12 +142,16 @@ class LimitedMemoryInverseHessian(object):
     """
     A class implementing the limit-memory BFGS approximation of the inverse Hessian
     """
-    def __init__(self, H0, shape):
+    def __init__(self, H0, shape, dtype=np.float64):
 
         self.H0k = H0
-        self.s   = np.zeros(shape)
-        self.y   = np.zeros(shape)
-        self.rho = np.zeros(shape[0])
+        self.s   = np.zeros(shape, dtype=dtype)
+        self.y   = np.zeros(shape, dtype=dtype)
+        self.rho = np.zeros(shape[0], dtype=dtype)
+
+        # the history arrays are circular buffers; `head` is the physical
+        # row holding the most recent correction pair
+        self.head = -1
 
     def __len__(self):
         return len(self.rho)
@@ -115,14 +164,9 @@ class LimitedMemoryInverseHessian(object):
 
     def update(self, sk, yk, logger=None):
         """
-        Update the inverse Hessian, by iterating the `s`, `y`,
-        and `rho` arrays and updating the value of `H0k`
+        Update the inverse Hessian, by advancing the circular `s`, `y`,
+        and `rho` buffers and updating the value of `H0k`
         """
-        # move everything down one element
-        self.s[:]   = np.roll(self.s, 1, axis=0)
-        self.y[:]   = np.roll(self.y, 1, axis=0)
-        self.rho[:] = np.roll(self.rho, 1)
-
         # updates for rho and H0k
         yy = np.linalg.norm(yk)
         yy *= yy
@@ -142,10 +186,12 @@ class LimitedMemoryInverseHessian(object):
         if (yy == 0.):
             raise LBFGSStepError("no difference in gradient norm; cannot compute LBFGS step")
 
-        # set the zero element, corresponding to this iteration
-        self.s[0] = sk
-        self.y[0] = yk
-        self.rho[0] = rhok
+        # write this iteration into the next circular-buffer row,
+        # overwriting the oldest entry once the history is full
+        self.head = (self.head + 1) % len(self.rho)
+        self.s[self.head] = sk
+        self.y[self.head] = yk
+        self.rho[self.head] = rhok
         self.H0k = 1.0 / (rhok*yy)
 
 class LBFGS(object):
@@ -157,7 +203,8 @@ class LBFGS(object):
     """
     logger = logging.getLogger("LBFGS")
 
-    def __init__(self, f, fprime, p0, args=[], kwargs={}, M=100, unscaler=None):
+    def __init__(self, f, fprime, p0, args=[], kwargs={}, M=100, unscaler=None,
+                    history_dtype=np.float64):
         """
         Parameters
         ----------
@@ -179,6 +226,10 @@ class LBFGS(object):
         unscaler : callable, optional
             a function that unscales the parameters back to their original
             values
+        history_dtype : numpy dtype, optional
+            the dtype of the s/y/rho history buffers; the objective stays
+            in float64, but well-scaled problems can use ``numpy.float32``
+            here to halve the memory traffic of the two-loop recursion
         """
         self.f        = f
         self.fprime   = fprime
@@ -186,6 +237,7 @@ class LBFGS(object):
         self.args     = args
         self.kwargs   = kwargs
         self.unscaler = unscaler
+        self.history_dtype = history_dtype
 
         # set the default options
         self.options = {}
@@ -206,7 +258,7 @@ class LBFGS(object):
         self.data['status']    = 0
 
         # the inverse Hessian
-        self.data['H'] = LimitedMemoryInverseHessian(1., (self.M, self.N))
+        self.data['H'] = LimitedMemoryInverseHessian(1., (self.M, self.N), dtype=self.history_dtype)
 
         # the current state
         X  = self.p0.copy()
@@ -305,7 +357,11 @@ class LBFGS(object):
 
             delta = abs(curr['F'] - prev['F'])
             max_val = max(curr['F'], prev['F'])
-            self.logger.info("convergence test: %.4e <= %.4e" %(delta / max(max_val, 1.), opt['factr'] * _epsilon))
+
+            # defer the formatting to the logging machinery, so silenced
+            # levels never pay for it
+            self.logger.info("convergence test: %.4e <= %.4e",
+                             delta / max(max_val, 1.), opt['factr'] * _epsilon)
             if delta / max(max_val, 1.) <= opt['factr'] * _epsilon:
                 self.logger.info("objective function has reached the required precision")
                 self.data['status'] = 2
@@ -387,9 +443,20 @@ class LBFGS(object):
         state = self.data['curr_state']
         q = state['G'].copy() # this is the memory that is returned
 
+        # use the compiled recursion if numba is available
+        if _two_loop_recursion is not None:
+            z = _two_loop_recursion(q, H['s'], H['y'], H['rho'], a, H['H0k'], k, H.head)
+
+            # normalize first step
+            if it == 0:
+                z /= state['Gnorm']
+            return z
+
+        M = len(H)
         for i in range(k):
-            a[i] = H['rho'][i] * np.dot(H['s'][i,:], q)
-            q -= a[i] * H['y'][i,:]
+            n = (H.head - i) % M # history rows, most recent first
+            a[i] = H['rho'][n] * np.dot(H['s'][n,:], q)
+            q -= a[i] * H['y'][n,:]
 
         # q is not used anymore after this, so we can use it as workspace
         z = q*H['H0k']
@@ -399,8 +466,9 @@ class LBFGS(object):
             z /= state['Gnorm']
 
         for i in reversed(range(k)):
-            beta = H['rho'][i] * np.dot(H['y'][i,:], z)
-            z += H['s'][i, :] * (a[i] - beta)
+            n = (H.head - i) % M
+            beta = H['rho'][n] * np.dot(H['y'][n,:], z)
+            z += H['s'][n, :] * (a[i] - beta)
 
         return z
 
@@ -433,21 +501,20 @@ class LBFGS(object):
         Returns
         -------
         newX : array_like
-            the new parameters satisfying the Armijo condition
+            the new parameters satisfying the Armijo condition, or ``None``
+            if no suitable parameters that minimize the objective can be
+            found in this direction
         newF : float
-            the value of the objective function at ``newX``
-
-        Raises
-        ------
-        LineSearchError :
-            cannot find suitable parameters that minimizes objective in
-            this direction
+            the value of the objective function at ``newX``, or ``None``
+            on failure
         """
         args = (self.f, state['X'], pk, state['G'], state['F'])
         alpha, _, newF = opt.linesearch.line_search_armijo(*args)
 
-        # failed to find new minimum value
-        if alpha is None: raise LineSearchError
+        # failed to find new minimum value; signal with a sentinel rather
+        # than an exception, since the caller tests this every iteration
+        if alpha is None:
+            return None, None
 
         # update the search parameters
         newX = state['X'] + alpha * pk
@@ -460,7 +527,7 @@ class LBFGS(object):
 
         See `LBFGS.default_options()` for default keyword options
         """
-        self.logger.info("options = %s" %options)
+        self.logger.info("options = %s", options)
         self.options.update(**options)
 
         # scratch workspace for alpha in LBFGS step
@@ -502,27 +569,25 @@ class LBFGS(object):
                 z[:] = state['G'] / state['Gnorm']
 
                 # reset the Hessian if direction strayed from gradient
-                self.data['H'] = LimitedMemoryInverseHessian(1., (self.M, self.N))
+                self.data['H'] = LimitedMemoryInverseHessian(1., (self.M, self.N), dtype=self.history_dtype)
 
             # do the linesearch
-            try:
-                newX, newF = self.do_linesearch(state, -z)
+            newX, newF = self.do_linesearch(state, -z)
 
-            except LineSearchError:
+            if newX is None:
 
                 # steepest descent already failed
                 if steepest_descent:
                     d['status'] = -4
                     break
-                else:
-                    # try line search along steepest descent
-                    z[:] = state['G'] / state['Gnorm']
-                    try:
-                        newX, newF = self.do_linesearch(state, -z)
-                        self.data['H'] = LimitedMemoryInverseHessian(1., (self.M, self.N))
-                    except:
-                        d['status'] = -4
-                        break
+
+                # try line search along steepest descent
+                z[:] = state['G'] / state['Gnorm']
+                newX, newF = self.do_linesearch(state, -z)
+                if newX is None:
+                    d['status'] = -4
+                    break
+                self.data['H'] = LimitedMemoryInverseHessian(1., (self.M, self.N), dtype=self.history_dtype)
 
             # update the states
             d['prev_state'].update(*d['curr_state'])
@@ -3,51 +3,147 @@ from ..results import LBFGSResults
 from .. import logging
 from . import tools, objectives, lbfgs
 
-import functools
 import time
 
 logger = logging.getLogger('rsdfit.lbfgs_fitter')
 
 
-def InitializeFromPrior(params):
+class _ObjectiveCall(object):
+    """
+    A lightweight callable binding an objective function to a fixed
+    ``scaling`` flag
+
+    Unlike :func:`functools.partial`, calling this does not rebuild a
+    keyword dictionary per call; the minimizer evaluates the objective
+    thousands of times per fit
+    """
+    __slots__ = ('fn', 'scaling')
+
+    def __init__(self, fn, scaling):
+        self.fn = fn
+        self.scaling = scaling
+
+    def __call__(self, x):
+        return self.fn(x, self.scaling)
+
+
+class _GradientCall(object):
+    """
+    A lightweight callable binding the objective gradient to its fixed
+    configuration, passing the arguments positionally per call
+    """
+    __slots__ = ('fn', 'epsilon', 'pool', 'use_priors', 'numerical',
+                 'numerical_from_lnlike', 'scaling')
+
+    def __init__(self, fn, epsilon, pool, use_priors, numerical,
+                  numerical_from_lnlike, scaling):
+        self.fn = fn
+        self.epsilon = epsilon
+        self.pool = pool
+        self.use_priors = use_priors
+        self.numerical = numerical
+        self.numerical_from_lnlike = numerical_from_lnlike
+        self.scaling = scaling
+
+    def __call__(self, x):
+        return self.fn(x, self.epsilon, self.pool, self.use_priors,
+                       self.numerical, self.numerical_from_lnlike, self.scaling)
+
+
+def _prior_bounds(params):
+    """
+    Return arrays of the effective lower/upper bounds of each parameter,
+    including the bounds of any uniform priors
+
+    This mirrors the test done by :func:`Parameter.within_bounds`, but
+    as arrays so a whole batch of candidates can be checked at once
+    """
+    lo = np.array([p.min_bound.value for p in params])
+    hi = np.array([p.max_bound.value for p in params])
+    for i, p in enumerate(params):
+        if p.has_prior and p.prior_name == 'uniform':
+            lo[i] = max(lo[i], p.prior.lower)
+            hi[i] = min(hi[i], p.prior.upper)
+    return lo, hi
+
+
+def InitializeFromPrior(params, batch_size=64):
     """
     Initialize by drawing from the prior
+
+    Candidate vectors are drawn from the priors in vectorized batches,
+    with the batch size growing geometrically on rejection, so tight
+    bounds cost extra vectorized draws rather than extra Python loops
     """
-    while True:
-        p0 = np.array([p.get_value_from_prior(size=1) for p in params])
-        for i, value in enumerate(p0):
-            params[i].value = value
+    lo, hi = _prior_bounds(params)
 
-        if all(p.within_bounds() for p in params):
+    while True:
+        # a batch of candidate vectors, with shape (batch_size, D)
+        candidates = np.column_stack([p.get_value_from_prior(size=batch_size)
+                                      for p in params])
+
+        # use the first candidate vector satisfying all bounds
+        mask = ((candidates >= lo) & (candidates <= hi)).all(axis=1)
+        if mask.any():
+            p0 = candidates[mask.argmax()]
             break
 
+        batch_size *= 2
+
+    # set the parameter values once, for the accepted vector only
+    for i, value in enumerate(p0):
+        params[i].value = value
+
     return p0
 
 
-def InitializeWithScatter(params, x, scatter):
+def InitializeWithScatter(params, x, scatter, batch_size=64):
     """
-    Initialize by drawing from the prior
+    Initialize by adding random scatter to the input values
+
+    Candidate vectors are drawn in vectorized batches, with the batch
+    size growing geometrically on rejection
     """
+    lo, hi = _prior_bounds(params)
     scale = scatter*x
 
     while True:
-        p0 = x + np.random.normal(scale=scale)
-        for i, value in enumerate(p0):
-            params[i].value = value
+        # a batch of candidate vectors, with shape (batch_size, D)
+        candidates = x + np.random.normal(scale=scale, size=(batch_size, len(x)))
 
-        if all(p.within_bounds() for p in params):
+        # use the first candidate vector satisfying all bounds
+        mask = ((candidates >= lo) & (candidates <= hi)).all(axis=1)
+        if mask.any():
+            p0 = candidates[mask.argmax()]
             break
 
+        batch_size *= 2
+
+    # set the parameter values once, for the accepted vector only
+    for i, value in enumerate(p0):
+        params[i].value = value
+
     return p0
 
 
+def _run_one_restart(init_values):
+    """
+    Run a single serial LBFGS fit from the input initial values, using
+    the global driver instance
+
+    This is defined at the module level so we can pickle it
+    """
+    from pyRSD.rsdfit import GlobalFittingDriver
+    driver = GlobalFittingDriver.get()
+    return _fit(driver.params, driver.theory.fit_params, None, init_values)
+
+
 def run(params, fit_params, pool=None, init_values=None):
     """
     Perform nonlinear fitting of a system using `scipy.optimize`.
 
     Any kwargs passed will not be used
     """
-    exception = None
     init_from = params['init_from'].value
 
     # draw initial values randomly from prior
@@ -65,12 +161,61 @@ def run(params, fit_params, pool=None, init_values=None):
         raise ValueError(
             "please specify how to initialize the maximum-likelihood solver")
 
+    # optionally scatter independent restarts across the pool, keeping
+    # the restart with the smallest objective; the per-rank fits run
+    # serially, so this uses the pool when the gradient itself is cheap
+    nrestarts = params.get('lbfgs_nrestarts', 1)
+    if nrestarts > 1 and pool is not None:
+
+        draws = [init_values]
+        scatter = params.get('init_scatter', 0.)
+        for i in range(nrestarts-1):
+            if init_from == 'prior':
+                draws.append(InitializeFromPrior(fit_params.free))
+            elif scatter > 0:
+                draws.append(InitializeWithScatter(fit_params.free, init_values, scatter))
+
+        if len(draws) == nrestarts:
+            logger.info("running %d independent LBFGS restarts in parallel" % nrestarts)
+            fits = pool.map(_run_one_restart, draws)
+
+            # the best restart is the one with the minimum objective
+            best = None
+            for results, exception in fits:
+                if results is None:
+                    continue
+                if best is None or results.min_chi2 < best[0].min_chi2:
+                    best = (results, exception)
+
+            if best is not None:
+                return best
+
+            # all restarts failed; report the first failure
+            return fits[0]
+
+        logger.warning("lbfgs_nrestarts > 1 requires 'init_from = prior' "
+                       "or a positive 'init_scatter'; running a single fit")
+
+    return _fit(params, fit_params, pool, init_values)
+
+
+def _fit(params, fit_params, pool, init_values):
+    """
+    Run a single LBFGS fit from the input initial values
+    """
+    exception = None
+
+    # computing the free names walks the full parameter table, so do it
+    # once here and reuse the result below
+    free_names = fit_params.free_names
+
     epsilon = params.get('lbfgs_epsilon', 1e-4)
     numerical = params.get('lbfgs_numerical', False)
     numerical_from_lnlike = params.get('lbfgs_numerical_from_lnlike', False)
     use_priors = params.get('lbfgs_use_priors', True)
     options = params.get('lbfgs_options', {})
     scaling = params.get('lbfgs_rescale', True)
+    mixed_precision = params.get('lbfgs_mixed_precision', False)
     options['test_convergence'] = params.get('test_convergence', False)
 
     if 'max_iter' in options and not options['test_convergence']:
@@ -80,10 +225,12 @@ def run(params, fit_params, pool=None, init_values=None):
         logger.info(
             "running LBFGS for %d iterations and then stopping" % maxiter)
 
-    # sort epsilon is a dictionary of values
+    # epsilon enters the finite-difference loops via broadcasting, so
+    # enforce a contiguous float array with one step per free parameter
     if isinstance(epsilon, dict):
-        epsilon = np.array([epsilon.get(k, 1e-4)
-                            for k in fit_params.free_names])
+        epsilon = [epsilon.get(k, 1e-4) for k in free_names]
+    epsilon = np.ascontiguousarray(
+        np.broadcast_to(epsilon, len(free_names)), dtype='f8')
 
     # log some info
     if use_priors:
@@ -91,24 +238,21 @@ def run(params, fit_params, pool=None, init_values=None):
     else:
         logger.info("running LBFGS minimizer without priors")
 
-    # setup the logging header
-    names = "   ".join(["%9s" % name for name in fit_params.free_names])
-    logging.info('{0:4s}   {1:s}   {2:9s}'.format('Iter', names, 'F(X)'))
+    # setup the logging header; skip building the string entirely when
+    # INFO messages are not going anywhere
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        names = "   ".join(["%9s" % name for name in free_names])
+        logging.info('{0:4s}   {1:s}   {2:9s}'.format('Iter', names, 'F(X)'))
 
     # determine the objective functions
     if use_priors:
-        f = functools.partial(objectives.minus_lnprob, scaling=scaling)
+        f = _ObjectiveCall(objectives.minus_lnprob, scaling)
     else:
-        f = functools.partial(objectives.minus_lnlike, scaling=scaling)
+        f = _ObjectiveCall(objectives.minus_lnlike, scaling)
+
     # the derivative
-    grad_kws = {}
-    grad_kws['epsilon'] = epsilon
-    grad_kws['pool'] = pool
-    grad_kws['use_priors'] = use_priors
-    grad_kws['scaling'] = scaling
-    grad_kws['numerical'] = numerical
-    grad_kws['numerical_from_lnlike'] = numerical_from_lnlike
-    fprime = functools.partial(objectives.grad_minus_lnlike, **grad_kws)
+    fprime = _GradientCall(objectives.grad_minus_lnlike, epsilon, pool,
+                           use_priors, numerical, numerical_from_lnlike, scaling)
 
     if numerical_from_lnlike:
         logger.info("computing gradient using numerical derivative of lnlike()")
@@ -127,17 +271,32 @@ def run(params, fit_params, pool=None, init_values=None):
         restart_data['funcalls'] = init_values.data['funcalls']
 
         # start from the last iteration of result
-        init_values = np.array([init_values[name]
-                                for name in fit_params.free_names])
+        init_values = init_values.to_array(free_names)
 
     # rescale the parameters?
     unscaler = None
     if scaling:
-        init_values = fit_params.scale(init_values)
-        unscaler = fit_params.inverse_scale
-
-    # iniitalize the minimizer
-    minimizer = lbfgs.LBFGS(f, fprime, init_values, unscaler=unscaler)
+        # snapshot the prior-based scaling arrays once; the ``locs`` and
+        # ``scales`` properties rebuild these from the parameter table on
+        # every access, and the minimizer unscales every iteration
+        locs = fit_params.locs
+        scales = fit_params.scales
+
+        init_values = (init_values - locs) / scales
+
+        # unscale into a preallocated scratch buffer, avoiding a fresh
+        # allocation on every call from the minimizer
+        xscratch = np.empty_like(init_values)
+        def unscaler(x):
+            np.multiply(x, scales, out=xscratch)
+            return np.add(xscratch, locs, out=xscratch)
+
+    # iniitalize the minimizer; optionally keep the LBFGS history in
+    # float32 -- valid when the parameters are well-scaled, since the
+    # objective itself stays in float64
+    history_dtype = np.float32 if mixed_precision else np.float64
+    minimizer = lbfgs.LBFGS(f, fprime, init_values, unscaler=unscaler,
+                            history_dtype=history_dtype)
 
     # restart config
     if len(restart_data):
@@ -165,8 +324,11 @@ def run(params, fit_params, pool=None, init_values=None):
         tools.hms_string(stop-start)))
     d = minimizer.data
 
-    if scaling:
-        d['curr_state'].X = fit_params.inverse_scale(d['curr_state'].X)
+    # a results object is only built for a clean run (or a keyboard
+    # interrupt), so only unscale the final state when it will be used
+    build_results = exception is None or isinstance(exception, KeyboardInterrupt)
+    if scaling and build_results:
+        d['curr_state'].X = d['curr_state'].X*scales + locs
 
     # extract the values to put them in the feedback
     if exception or d['status'] <= 0:
@@ -180,6 +342,6 @@ def run(params, fit_params, pool=None, init_values=None):
         logger.info("   convergence message: %s" % d['status'])
 
     results = None
-    if exception is None or isinstance(exception, KeyboardInterrupt):
+    if build_results:
         results = LBFGSResults(d, fit_params)
     return results, exception
@@ -1,5 +1,59 @@
 from pyRSD.rsdfit import GlobalFittingDriver
 
+import collections
+
+# a small cache of recent objective evaluations, keyed on the parameter
+# vector; the line-search and the finite-difference gradient both evaluate
+# the objective at the current point, so remember the last few values to
+# avoid recomputing the model there
+_cache_maxsize = 4
+_cache = collections.OrderedDict()
+
+
+def _cached_minus_lnlike(driver, x, use_priors):
+    """
+    Evaluate ``driver.minus_lnlike``, remembering the last few evaluations
+
+    The cache is keyed on the raw bytes of the parameter vector, so
+    repeated evaluations at the same point (e.g., the center point hit by
+    both the line-search and the gradient) are free.
+    """
+    if x is None:
+        return driver.minus_lnlike(x, use_priors=use_priors)
+
+    key = (id(driver), x.tobytes(), use_priors)
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+
+    value = driver.minus_lnlike(x, use_priors=use_priors)
+    _cache[key] = value
+    while len(_cache) > _cache_maxsize:
+        _cache.popitem(last=False)
+    return value
+
+
+# memo of the last unscaling transform; the minimizer evaluates the
+# objective and its gradient back-to-back at the same scaled point, so
+# the second affine map can reuse the first
+_unscale_memo = [None, None]
+
+
+def _inverse_scale(driver, x):
+    """
+    Unscale the parameter vector ``x``, reusing the result when the
+    previous call unscaled the very same point
+    """
+    key = (id(driver), x.tobytes())
+    if _unscale_memo[0] == key:
+        return _unscale_memo[1]
+
+    physical = driver.theory.fit_params.inverse_scale(x)
+    _unscale_memo[0] = key
+    _unscale_memo[1] = physical
+    return physical
+
 
 def minus_lnlike(x=None, scaling=False):
     """
@@ -7,8 +61,8 @@ def minus_lnlike(x=None, scaling=False):
     """
     driver = GlobalFittingDriver.get()
     if scaling:
-        x = driver.theory.fit_params.inverse_scale(x)
-    return driver.minus_lnlike(x, use_priors=False)
+        x = _inverse_scale(driver, x)
+    return _cached_minus_lnlike(driver, x, use_priors=False)
 
 
 def minus_lnprob(x=None, scaling=False):
@@ -17,8 +71,8 @@ def minus_lnprob(x=None, scaling=False):
     """
     driver = GlobalFittingDriver.get()
     if scaling:
-        x = driver.theory.fit_params.inverse_scale(x)
-    return driver.minus_lnlike(x, use_priors=True)
+        x = _inverse_scale(driver, x)
+    return _cached_minus_lnlike(driver, x, use_priors=True)
 
 
 def lnprob(x=None, scaling=False):
@@ -27,21 +81,24 @@ def lnprob(x=None, scaling=False):
     """
     driver = GlobalFittingDriver.get()
     if scaling:
-        x = driver.theory.fit_params.inverse_scale(x)
+        x = _inverse_scale(driver, x)
     return driver.lnprob(x)
 
 
-def grad_minus_lnlike(x, **kwargs):
+def grad_minus_lnlike(x, epsilon=1e-4, pool=None, use_priors=True,
+                        numerical=False, numerical_from_lnlike=False,
+                        scaling=False):
     """
     Wrapper for ``FittingDriver.gradient`` which explictly
     grabs the pickeable ``nlopt_lnlike``
     """
-    scaling = kwargs.pop('scaling', False)
     driver = GlobalFittingDriver.get()
 
     if scaling:
-        x = driver.theory.fit_params.inverse_scale(x)
-    grad = driver.grad_minus_lnlike(x, **kwargs)
+        x = _inverse_scale(driver, x)
+    grad = driver.grad_minus_lnlike(x, epsilon=epsilon, pool=pool,
+                                    use_priors=use_priors, numerical=numerical,
+                                    numerical_from_lnlike=numerical_from_lnlike)
     if scaling:
         grad = driver.theory.fit_params.scale_gradient(grad)
 
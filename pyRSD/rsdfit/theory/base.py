@@ -39,23 +39,20 @@ class Schema(type):
         cls._extra_params = set()
         cls._deprecated = set()
 
-        # loop over each attribute
-        for name in cls.__dict__:
-            p = cls.__dict__[name]
-            if isinstance(p, FreeProperty):
-                if not p.deprecated:
-                    cls._free.add(name)
-                    if p.model_param: cls._model_params.add(name)
-                    else: cls._extra_params.add(name)
-                else:
-                    cls._deprecated.add(name)
-            elif isinstance(p, FixedProperty):
-                if not p.deprecated:
-                    cls._fixed.add(name)
-                    if p.model_param: cls._model_params.add(name)
-                    else: cls._extra_params.add(name)
-                else:
-                    cls._deprecated.add(name)
+        # loop over each attribute, dispatching on the exact descriptor
+        # type; the free()/fixed() decorators only ever produce direct
+        # FreeProperty/FixedProperty instances
+        buckets = {FreeProperty : cls._free, FixedProperty : cls._fixed}
+        for name, p in cls.__dict__.items():
+            bucket = buckets.get(type(p))
+            if bucket is None:
+                continue
+            if p.deprecated:
+                cls._deprecated.add(name)
+            else:
+                bucket.add(name)
+                if p.model_param: cls._model_params.add(name)
+                else: cls._extra_params.add(name)
 
 
 class FreeProperty(Property):
@@ -79,12 +76,22 @@ def free(model_param=True, deprecated=False):
         name = f.__name__
         _name = '__'+name
 
+        # the static keywords are known at decoration time, so resolve
+        # them once here rather than on every (first) property access
+        _static = {'vary':True, 'name':name, 'description':f.__doc__.strip()}
+
         @functools.wraps(f)
         def _get_property(self):
-            val = f(self)
-            val['vary'] = True
-            val['name'] = name
-            val['description'] = f.__doc__.strip()
+            # the resolved keyword spec is static, so cache it on the
+            # owning instance; each access still returns a fresh Parameter,
+            # which callers are free to mutate
+            cache = self.__dict__.setdefault('_param_spec_cache', {})
+            try:
+                val = cache[name]
+            except KeyError:
+                val = f(self)
+                val.update(_static)
+                cache[name] = val
             return Parameter(**val)
 
         if deprecated: _get_property = deprecated_parameter(_get_property)
@@ -103,12 +110,21 @@ def fixed(model_param=False, deprecated=False):
         name = f.__name__
         _name = '__'+name
 
+        # see the note in free(): the static keywords are resolved once
+        # at decoration time
+        _static = {'vary':False, 'name':name, 'description':f.__doc__.strip()}
+
         @functools.wraps(f)
         def _get_property(self):
-            val = f(self)
-            val['vary'] = False
-            val['name'] = name
-            val['description'] = f.__doc__.strip()
+            # see the note in free(): the static keyword spec is cached,
+            # but a fresh Parameter is returned on each access
+            cache = self.__dict__.setdefault('_param_spec_cache', {})
+            try:
+                val = cache[name]
+            except KeyError:
+                val = f(self)
+                val.update(_static)
+                cache[name] = val
             return Parameter(**val)
 
         if deprecated: _get_property = deprecated_parameter(_get_property)
@@ -209,11 +225,13 @@ class BasePowerParameters(ParameterSet):
             # update with values from file
             fromfile = super(BasePowerParameters, cls).from_file(filename, tags=tag)
             params.tag = fromfile.tag # transfer the tag
-            for name in fromfile:
 
-                # ignore deprecated parameters
-                if name not in cls.defaults.deprecated:
-                    params.add(**fromfile[name].to_dict())
+            # ignore deprecated parameters; use the metaclass set directly,
+            # rather than re-sorting the deprecated names per iteration
+            deprecated = cls.defaults._deprecated
+            for name, par in fromfile.items():
+                if name not in deprecated:
+                    params.add(**par.to_dict())
 
             # first add this to the symtable, before updating constraints
             params.register_function('sigmav_from_bias', params.model.sigmav_from_bias)
@@ -233,6 +251,9 @@ class BasePowerParameters(ParameterSet):
                     p.vary = False
                     p.constrained = False
 
+        # the loop above mutates ``vary``/``constrained`` directly
+        params._invalidate_free_cache()
+
         return params
 
     @property
@@ -243,21 +264,290 @@ class BasePowerParameters(ParameterSet):
         """
         return self.defaults.model_params
 
+    # cached views of the free parameters; ``None`` means the cache is
+    # stale and must be rebuilt
+    _free_bounds = None
+    _free_names = None
+    _free_params = None
+    _free_prior_spec = None
+    _free_locs = None
+    _free_scales = None
+    _grad_valid_names = None
+
+    # the last free parameter vector actually pushed to the model;
+    # ``None`` means the model state is unknown and a full update is
+    # required. We compare against this snapshot rather than tracking
+    # value assignments, since several code paths set ``Parameter.value``
+    # directly
+    _last_model_theta = None
+    _dependents = None
+
+    def _invalidate_free_cache(self):
+        """
+        Invalidate the cached views of the free parameters; called from
+        every mutation path that can change the free set
+        """
+        self._free_bounds = None
+        self._free_names = None
+        self._free_params = None
+        self._free_prior_spec = None
+        self._free_locs = None
+        self._free_scales = None
+        self._grad_valid_names = None
+        self._last_model_theta = None
+
+    # names that already passed validation on this instance; repeated
+    # assignments of the same name skip straight to one set lookup
+    _validated_names = None
+
     def __setitem__(self, name, value):
         """
         Only allow names to be set if they are a valid parameter, and
         if not, crash
         """
-        if not self.is_valid(name):
-            raise RuntimeError("`%s` is not a valid parameter name" %name)
+        validated = self._validated_names
+        if validated is None:
+            validated = self._validated_names = set()
+        if name not in validated:
+            if not self.is_valid(name):
+                raise RuntimeError("`%s` is not a valid parameter name" %name)
+            validated.add(name)
+        self._invalidate_free_cache()
         ParameterSet.__setitem__(self, name, value)
 
+    def __delitem__(self, name):
+        self._invalidate_free_cache()
+        ParameterSet.__delitem__(self, name)
+
+    def prepare_params(self):
+        ParameterSet.prepare_params(self)
+        self._invalidate_free_cache()
+
+        # map each parameter to the constrained parameters that depend on
+        # it (transitively, via the resolved deps), for dirty tracking of
+        # model updates
+        dependents = {}
+        for name, par in self.items():
+            for dep in getattr(par, 'deps', []):
+                dependents.setdefault(dep, set()).add(name)
+        self._dependents = dependents
+
+    def update_param(self, *name, **kwargs):
+        self._invalidate_free_cache()
+        ParameterSet.update_param(self, *name, **kwargs)
+
+    @property
+    def free_names(self):
+        """
+        The sorted free parameter names, cached between mutations of the
+        parameter set; computing these walks the full parameter table
+        """
+        if self._free_names is None:
+            self._free_names = ParameterSet.free_names.fget(self)
+        return self._free_names
+
+    @property
+    def free(self):
+        """
+        The free `Parameter` objects, cached between mutations of the
+        parameter set; the objects themselves are stable identities that
+        are updated in place
+        """
+        if self._free_params is None:
+            self._free_params = [self[k] for k in self.free_names]
+        return self._free_params
+
+    @property
+    def free_values(self):
+        """
+        The free parameter values, gathered into a contiguous array with
+        a single pass over the cached free Parameter objects
+        """
+        free = self.free
+        return np.fromiter((p.value for p in free), dtype='f8', count=len(free))
+
+    @property
+    def locs(self):
+        """
+        The locs of the free parameters, cached as a contiguous array
+        between mutations of the parameter set
+        """
+        if self._free_locs is None:
+            self._free_locs = np.ascontiguousarray(
+                ParameterSet.locs.fget(self), dtype='f8')
+        return self._free_locs
+
+    @property
+    def scales(self):
+        """
+        The scales of the free parameters, cached as a contiguous array
+        between mutations of the parameter set
+        """
+        if self._free_scales is None:
+            self._free_scales = np.ascontiguousarray(
+                ParameterSet.scales.fget(self), dtype='f8')
+        return self._free_scales
+
+    def _get_free_prior_spec(self):
+        """
+        Return the arrays describing the priors of the free parameters,
+        for use in the vectorized :func:`lnprior_free` and
+        :func:`dlnprior_free`
+
+        Returns ``False`` when a free parameter requires the
+        per-parameter code path, i.e., when it uses the analytic
+        (smoothed) approximations or callable uniform limits
+        """
+        if self._free_prior_spec is None:
+            spec = {}
+            free = self.free
+            N = len(free)
+
+            # prior kind per parameter: 0 = none, 1 = uniform, 2 = normal
+            kind = np.zeros(N, dtype=int)
+            mins = np.full(N, -np.inf)
+            maxs = np.full(N, np.inf)
+            center = np.zeros(N); width = np.ones(N)
+            mu = np.zeros(N); sigma = np.ones(N)
+            const = np.zeros(N)
+
+            for i, p in enumerate(free):
+                if p.analytic:
+                    spec = False
+                    break
+                mins[i] = p.min_bound.value
+                maxs[i] = p.max_bound.value
+                if not p.has_prior:
+                    continue
+                if p.prior_name == 'uniform':
+                    if callable(p.prior._lower) or callable(p.prior._upper):
+                        spec = False
+                        break
+                    kind[i] = 1
+                    center[i] = 0.5*(p.prior.lower + p.prior.upper)
+                    width[i] = p.prior.upper - p.prior.lower
+                    const[i] = -np.log(width[i])
+                else:
+                    kind[i] = 2
+                    mu[i] = p.prior.mu
+                    sigma[i] = p.prior.sigma
+                    const[i] = -0.5*np.log(2*np.pi*sigma[i]**2)
+
+            if spec is not False:
+                spec['kind'] = kind
+                spec['mins'] = mins; spec['maxs'] = maxs
+                spec['center'] = center; spec['width'] = width
+                spec['mu'] = mu; spec['sigma'] = sigma
+                spec['const'] = const
+                spec['normal'] = np.nonzero(kind == 2)[0]
+                spec['uniform'] = np.nonzero(kind == 1)[0]
+            self._free_prior_spec = spec
+
+        return self._free_prior_spec
+
+    def lnprior_free(self):
+        """
+        Return the log prior of the free parameters as the sum of the
+        priors of each individual parameter
+
+        When possible, the sum is computed with a single vectorized
+        evaluation over the cached prior arrays rather than a Python
+        loop over parameters
+        """
+        spec = self._get_free_prior_spec()
+        if spec is False:
+            return sum(p.lnprior for p in self.free)
+
+        x = np.array([p.user_value for p in self.free])
+
+        # outside the effective bounds, the log prior is -inf
+        lo, hi = self._get_free_bounds()
+        if not ((x >= lo) & (x <= hi)).all():
+            return -np.inf
+
+        # within bounds, only the normal priors contribute an x-dependent
+        # term; the rest is a precomputed constant
+        toret = spec['const'].sum()
+        nn = spec['normal']
+        if len(nn):
+            z = (x[nn] - spec['mu'][nn])/spec['sigma'][nn]
+            toret += -0.5*np.sum(z**2)
+        return toret
+
+    def dlnprior_free(self):
+        """
+        Return the derivative of the log prior of the free parameters,
+        as an array
+
+        When possible, this is computed with vectorized evaluations over
+        the cached prior arrays rather than a Python loop over parameters
+        """
+        spec = self._get_free_prior_spec()
+        if spec is False:
+            return np.array([p.dlnprior for p in self.free])
+
+        x = np.array([p.user_value for p in self.free])
+        k = 1000
+
+        # the smoothed min/max bound terms; ~0 away from the bounds and
+        # large near/beyond them, as in BoundDistribution.deriv_log_pdf
+        t1 = -2*k*(x - spec['mins'])
+        t2 = -2*k*(spec['maxs'] - x)
+        toret = 2*k*(np.exp(t1 - np.logaddexp(0, t1)) - np.exp(t2 - np.logaddexp(0, t2)))
+
+        # the uniform terms, as in Uniform._analytic_deriv_log_pdf
+        uu = spec['uniform']
+        if len(uu):
+            w = spec['width'][uu]
+            y = (x[uu] - spec['center'][uu])/w
+            y_ = -2*k*(0.25 - y**2)
+            ratio = np.exp(y_ - np.logaddexp(0, y_))
+            toret[uu] += (1./w) * -4*y*k * ratio
+
+        # the normal terms
+        nn = spec['normal']
+        if len(nn):
+            toret[nn] += (spec['mu'][nn] - x[nn])/spec['sigma'][nn]**2
+
+        return toret
+
+    def _get_free_bounds(self):
+        """
+        Return the effective ``(lo, hi)`` bound arrays of the free
+        parameters, mirroring the per-parameter test done by
+        :func:`Parameter.within_bounds`
+
+        The arrays are cached, and rebuilt whenever the parameter set
+        is mutated
+        """
+        if self._free_bounds is None:
+            lo = []; hi = []
+            for p in self.free:
+                lo.append(p.min_bound.value)
+                hi.append(p.max_bound.value)
+                if p.has_prior and p.prior_name == 'uniform':
+                    lo[-1] = max(lo[-1], p.prior.lower)
+                    hi[-1] = min(hi[-1], p.prior.upper)
+            self._free_bounds = (np.array(lo), np.array(hi))
+        return self._free_bounds
+
     def is_valid(self, name):
         """
         Check if the parameter name is valid
         """
+        # test membership against the underlying sets gathered by the
+        # Schema metaclass; going through the defaults' list properties
+        # would re-sort them on every __setitem__
+        defaults = self.defaults
+        if (name in defaults._model_params or name in defaults._extra_params
+                or name in defaults._deprecated):
+            return True
+
         extras = getattr(self, 'extra_params', [])
-        return name in self.defaults or name in self.defaults.deprecated or name in extras
+        cached = getattr(self, '_extra_param_set', None)
+        if cached is None or len(cached) != len(extras):
+            cached = self._extra_param_set = frozenset(extras)
+        return name in cached
 
     def to_dict(self):
         """
@@ -283,8 +573,11 @@ class BasePowerParameters(ParameterSet):
             to successfully set the free parameters and update the model
         """
         # only set and update the model when all free params are
-        # within max/min bounds and uniform prior bounds
-        if not all(p.within_bounds(theta[i]) for i,p in enumerate(self.free)):
+        # within max/min bounds and uniform prior bounds; the cached
+        # bound arrays make this a single vectorized check
+        lo, hi = self._get_free_bounds()
+        theta = np.asarray(theta)
+        if not ((theta >= lo) & (theta <= hi)).all():
             return False
 
         # try to update
@@ -296,8 +589,28 @@ class BasePowerParameters(ParameterSet):
             msg += "   current parameters:\n%s\n" %str(self.fit_params)
             msg += "   traceback:\n%s" %(traceback.format_exc())
             raise RuntimeError(msg)
+        # only push the model parameters whose values changed since the
+        # last model update; when the model state is unknown, send them all
         try:
-            self.model.update(**self.to_dict())
+            last = self._last_model_theta
+            dependents = self._dependents
+            if last is None or dependents is None:
+                self.model.update(**self.to_dict())
+            else:
+                # the names whose values changed, plus the constrained
+                # parameters that depend on them
+                names = self.free_names
+                dirty = set()
+                for i in np.flatnonzero(theta != last):
+                    dirty.add(names[i])
+                    dirty.update(dependents.get(names[i], ()))
+
+                valid = self.defaults._model_params
+                kwargs = dict((key, self[key].value) for key in dirty
+                              if key in valid and key in self)
+                if len(kwargs):
+                    self.model.update(**kwargs)
+            self._last_model_theta = np.array(theta, dtype='f8')
         except Exception as e:
             import traceback
             msg = "exception while trying to update the theoretical model:\n"
@@ -343,19 +656,27 @@ class BasePowerParameters(ParameterSet):
         else:
             return doing_okay
 
-    def scale(self, theta):
+    def scale(self, theta, out=None):
         """
         Scale the (unscaled) free parameters, using the priors to
         define the scaling transformation
+
+        If ``out`` is provided, the result is written into it in-place,
+        avoiding a fresh allocation
         """
-        return (theta - self.locs) / self.scales
+        out = np.subtract(theta, self.locs, out=out)
+        return np.true_divide(out, self.scales, out=out)
 
-    def inverse_scale(self, theta):
+    def inverse_scale(self, theta, out=None):
         """
         Inverse scale the free parameters, using the priors to
         define the scaling transformation
+
+        If ``out`` is provided, the result is written into it in-place,
+        avoiding a fresh allocation
         """
-        return theta*self.scales + self.locs
+        out = np.multiply(theta, self.scales, out=out)
+        return np.add(out, self.locs, out=out)
 
     def scale_gradient(self, grad):
         """
@@ -408,9 +729,6 @@ class BasePowerTheory(object):
         self._model_cls = model_cls
         self.model = model
 
-        # read the parameter file lines and save them for pickling
-        self._readlines = open(param_file, 'r').readlines()
-
         # read any extra parameters and make a dict
         self.extra_params = []
         if extra_param_file is not None:
@@ -516,6 +834,23 @@ class BasePowerTheory(object):
     #---------------------------------------------------------------------------
     # properties
     #---------------------------------------------------------------------------
+    @property
+    def _readlines(self):
+        """
+        The parameter-file content, rendered on demand from the
+        in-memory parameter sets
+
+        Historically the raw file lines were read at construction and
+        carried around for pickling; rendering instead avoids the extra
+        I/O and keeps pickled theory objects small
+        """
+        from io import BytesIO
+        buff = BytesIO()
+        self.fit_params.to_file(buff)
+        kwargs = {'header_name':'model params', 'footer':True, 'as_dict':False}
+        self.model_params.to_file(buff, **kwargs)
+        return buff.getvalue().decode().splitlines(keepends=True)
+
     @property
     def ndim(self):
         """
@@ -530,7 +865,7 @@ class BasePowerTheory(object):
         Return the log prior for free parameters as the sum of the priors
         of each individual parameter
         """
-        return sum(param.lnprior for param in self.free)
+        return self.fit_params.lnprior_free()
 
     @property
     def lnprior_constrained(self):
@@ -553,7 +888,7 @@ class BasePowerTheory(object):
         """
         Return the derivative of the log prior for all "free" parameters
         """
-        return np.array([p.dlnprior for p in self.free])
+        return self.fit_params.dlnprior_free()
 
     #---------------------------------------------------------------------------
     # convenience attributes
@@ -565,11 +900,15 @@ class BasePowerTheory(object):
         """
         free = self.free_names
         params = self.fit_params
-        toret = [params[key].fiducial for key in free]
-        if None in toret:
-            names = [free[i] for i in range(len(free)) if toret[i] is None]
+
+        # build the array directly, marking missing fiducials with NaN
+        toret = np.fromiter((np.nan if params[key].fiducial is None else params[key].fiducial
+                             for key in free), dtype='f8', count=len(free))
+        missing = np.isnan(toret)
+        if missing.any():
+            names = [free[i] for i in np.nonzero(missing)[0]]
             raise ValueError("fiducial values missing for parameters: %s" %str(names))
-        return np.array(toret)
+        return toret
 
     @property
     def free_names(self):
@@ -636,6 +975,10 @@ class BasePowerTheory(object):
         # NOTE: this allows us to evaluate the model only ONCE
         k, mu, slices = self.get_kmu_pairs(transfers)
 
+        # the (ndim, Nk) output buffer, allocated on the first call; the
+        # layout is fixed across calls, so later calls fill it in place
+        state = {'out' : None}
+
         def evaluate(theta, pool=None, epsilon=1e-4, numerical=False):
 
             # update model parameters first?
@@ -643,18 +986,27 @@ class BasePowerTheory(object):
                 self.model.update(**model_params)
 
             # evaluate the P(k,mu) gradient
-            gradient = self.pkmu_gradient(k, mu, theta, 
-                                          pool=pool, 
-                                          epsilon=epsilon, 
+            gradient = self.pkmu_gradient(k, mu, theta,
+                                          pool=pool,
+                                          epsilon=epsilon,
                                           numerical=numerical)
 
-            # apply to transfer for gradient of each parameter
-            grad_lnlike = []
-            for i in range(self.ndim):
-                grad_lnlike.append(apply_transfers(gradient[i], data, transfers, 
-                                                    stat_ids, slices, theory_decorator))
+            # apply the transfers for the gradient of each parameter,
+            # writing each row directly into the output buffer
+            out = state['out']
+            if out is None:
+                first = apply_transfers(gradient[0], data, transfers,
+                                        stat_ids, slices, theory_decorator)
+                out = state['out'] = np.empty((self.ndim, len(first)))
+                out[0] = first
+            else:
+                apply_transfers(gradient[0], data, transfers, stat_ids,
+                                slices, theory_decorator, out=out[0])
+            for i in range(1, self.ndim):
+                apply_transfers(gradient[i], data, transfers, stat_ids,
+                                slices, theory_decorator, out=out[i])
 
-            return np.asarray(grad_lnlike)
+            return out
 
         return evaluate
 
@@ -686,6 +1038,10 @@ class BasePowerTheory(object):
         # NOTE: this allows us to evaluate the model only ONCE
         k, mu, slices = self.get_kmu_pairs(transfers)
 
+        # the output buffer, allocated on the first call; the layout is
+        # fixed across calls, so later calls write into it in place
+        state = {'out' : None}
+
         def evaluate():
 
             # update model parameters first?
@@ -696,7 +1052,10 @@ class BasePowerTheory(object):
             P = self.model.power(k,mu)
 
             # apply the transfers to the power
-            return apply_transfers(P, data, transfers, stat_ids, slices, theory_decorator)
+            out = apply_transfers(P, data, transfers, stat_ids, slices,
+                                  theory_decorator, out=state['out'])
+            state['out'] = out
+            return out
 
         return evaluate
 
@@ -707,20 +1066,69 @@ class BasePowerTheory(object):
 
         This also computes the slices needed to recover the pairs for
         individual transfer functions.
+
+        The (k,mu) geometry is static for the lifetime of the fit, so the
+        result is computed once per set of transfers and cached; the k and
+        mu values are returned as rows of a single contiguous buffer
         """
+        key = tuple(id(t) for t in transfers)
+        cache = getattr(self, '_kmu_pairs_cache', None)
+        if cache is None:
+            cache = self._kmu_pairs_cache = {}
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        N = sum(len(t.flatk) for t in transfers)
+        buf = np.empty((2, N))
         start = 0
         slices = []
-        k = []; mu = []
         for i, t in enumerate(transfers):
-            k.append(t.flatk)
-            mu.append(t.flatmu)
-            N = len(t.flatk)
-            slices.append(slice(start, start+N))
-            start += N
-
-        return np.concatenate(k), np.concatenate(mu), slices
+            sl = slice(start, start+len(t.flatk))
+            buf[0,sl] = t.flatk
+            buf[1,sl] = t.flatmu
+            slices.append(sl)
+            start = sl.stop
+
+        cache[key] = (buf[0], buf[1], slices)
+        return cache[key]
+
+# cache of the label-to-position lookups used by the single-transfer
+# fast path in apply_transfers
+_sel_loc_cache = {}
+
+# cache of the linear operators used to interpolate window-convolved
+# results; spline interpolation is linear in the data values, so for
+# fixed knots and query points the whole map is one cached matrix
+_spline_op_cache = {}
+
+# fast memo in front of _spline_operator, keyed structurally on the
+# transfer/statistic/bin identity; the grids are static per transfer
+# for the lifetime of a fit, so this avoids re-hashing the grid bytes
+# on every sampler step
+_spline_op_memo = {}
+
+def _spline_operator(knots, xq):
+    """
+    Return the matrix ``A`` such that ``A.dot(y)`` equals
+    ``spline(knots, y)(xq)``, cached on the (static) knot and query grids
 
-def apply_transfers(P, data, transfers, stat_ids, slices, theory_decorator):
+    This replaces building a fresh spline on every evaluation with a
+    single matrix-vector product
+    """
+    key = (knots.tobytes(), xq.tobytes())
+    try:
+        return _spline_op_cache[key]
+    except KeyError:
+        basis = np.eye(len(knots))
+        op = np.empty((len(xq), len(knots)))
+        for j in range(len(knots)):
+            op[:,j] = spline(knots, basis[j])(xq)
+        _spline_op_cache[key] = op
+        return op
+
+def apply_transfers(P, data, transfers, stat_ids, slices, theory_decorator, out=None):
     """
     Apply one (or more) transfer functions to the input P(k,mu) values.
 
@@ -739,6 +1147,9 @@ def apply_transfers(P, data, transfers, stat_ids, slices, theory_decorator):
         the list of slices to slice the power result
     theory_decorator : dict
         decorator to run after the transfer function is applied
+    out : array_like, optional
+        if provided, write the flattened result into this preallocated
+        buffer instead of concatenating a fresh array
     """
     # determine which variables specify the second dimension of the basis
     # based on the mode, pkmu or poles
@@ -752,8 +1163,16 @@ def apply_transfers(P, data, transfers, stat_ids, slices, theory_decorator):
     # concatenate results into a single array if we had multiple transfers
     if len(results) > 1:
         result = xr.concat(results, dim=results[0].dims[-1])
+        fast = False
     else:
+        # single-transfer fast path: bin selection reduces to indexing
+        # the raw values along the bin axis, with the label-to-position
+        # lookup cached, bypassing the per-call xarray sel machinery
         result = results[0]
+        fast = dim in result.dims
+        if fast:
+            values = result.values
+            axis = result.dims.index(dim)
 
     # format the results
     toret = []
@@ -773,18 +1192,31 @@ def apply_transfers(P, data, transfers, stat_ids, slices, theory_decorator):
         for bb in binval:
 
             # select the proper binval from the DataArray
-            r = result.sel(**{dim:bb})
+            if fast:
+                key = (id(transfers[0]), result.dims, result.shape, dim, bb)
+                loc = _sel_loc_cache.get(key)
+                if loc is None:
+                    loc = _sel_loc_cache[key] = result.indexes[dim].get_loc(bb)
+                r_vals = np.take(values, loc, axis=axis)
+            else:
+                r = result.sel(**{dim:bb})
+                r_vals = r.values
 
             # interpolate the window function results
             if isinstance(transfers[0], WindowFunctionTransfer):
-                spl = spline(r['k'], r)
-                theory.append(spl(m.k))
+                okey = (id(transfers[0]), stat_name, bb, result.shape)
+                op = _spline_op_memo.get(okey)
+                if op is None:
+                    r_k = result['k'] if fast else r['k']
+                    op = _spline_operator(np.asarray(r_k), np.asarray(m.k))
+                    _spline_op_memo[okey] = op
+                theory.append(op.dot(r_vals))
             # remove out of range values from Gridded Transfer results
             elif isinstance(transfers[0], gridded_transfers):
-                theory.append(r.values[r.notnull()])
+                theory.append(r_vals[~np.isnan(r_vals)])
             # result already has the proper k binning
             else:
-                theory.append(r.values)
+                theory.append(r_vals)
 
         # apply any theory decorators for this statistic
         dec = theory_decorator.get(stat_name, None)
@@ -803,4 +1235,13 @@ def apply_transfers(P, data, transfers, stat_ids, slices, theory_decorator):
 
         toret.append(theory)
 
-    return np.concatenate(toret)
+    if out is None:
+        return np.concatenate(toret)
+
+    # write into the caller's preallocated buffer; the output layout is
+    # fixed across calls for a given set of statistics
+    start = 0
+    for theory in toret:
+        out[start:start+len(theory)] = theory
+        start += len(theory)
+    return out